@@ -8,252 +8,286 @@ Root cause: macOS won't send key events to a border-less window unless the
  the field immediately.
 
 Additional fixes for Monterey:
-- Use NSTextView instead of NSTextField for reliable input handling
-- More aggressive focus and field editor management
+- Plain NSTextField for the answer; focus is judged by its field editor
+- Focus is re-taken whenever the window becomes key (no polling timers)
 - Force cursor visibility with explicit selection
 
-Tested on macOS 14.5 with PyObjC 10.1 / Python 3.13.
+Originally tested on macOS 14.5 with PyObjC 10.1 / Python 3.13; the
+NSTextField input, notification-driven focus, accessory activation policy
+and hand-pumped event loop have not been re-tested on macOS since.
 """
 from __future__ import annotations
-import random, AppKit
-from Foundation import NSObject, NSTimer, NSString, NSRange
+import argparse, random, traceback, objc
+from AppKit import (NSApp, NSApplication, NSColor, NSEvent, NSFont, NSScreen,
+                    NSRunningApplication, NSTextField, NSWindow,
+                    NSBackingStoreBuffered, NSCenterTextAlignment,
+                    NSRightTextAlignment, NSFontWeightRegular, NSKeyDownMask,
+                    NSAnyEventMask, NSStatusWindowLevel, NSWindowStyleMaskBorderless,
+                    NSWindowDidBecomeKeyNotification,
+                    NSApplicationActivateIgnoringOtherApps,
+                    NSApplicationActivationPolicyAccessory,
+                    NSApplicationPresentationHideDock,
+                    NSApplicationPresentationDisableProcessSwitching)
+from Foundation import (NSObject, NSTimer, NSRange, NSNotificationCenter,
+                        NSNumberFormatter, NSNumberFormatterNoStyle, NSLocale,
+                        NSDate, NSDefaultRunLoopMode)
+from Quartz import CAKeyframeAnimation, kCAAnimationDiscrete
 
 TOTAL_QUESTIONS = 3
 FAIL_THRESHOLD = 2
-FONT_BIG   = AppKit.NSFont.systemFontOfSize_(64)
-FONT_MED   = AppKit.NSFont.systemFontOfSize_(56)
-FONT_SMALL = AppKit.NSFont.systemFontOfSize_(24)
+FONT_BIG   = NSFont.systemFontOfSize_(64)
+FONT_MED   = NSFont.systemFontOfSize_(56)
+FONT_SMALL = NSFont.monospacedDigitSystemFontOfSize_weight_(24, NSFontWeightRegular)
+BLACK    = NSColor.blackColor()
+WHITE    = NSColor.whiteColor()
+BLACK_CG = BLACK.CGColor()
+GREEN_CG = NSColor.greenColor().CGColor()
+RED_CG   = NSColor.redColor().CGColor()
 PREFIX = "Problems left before Zohar can waste her time on YouTube: "
 STRIKE_PREFIX = "Strikes: "
-
-OPS = [
-    ('+',  lambda a, b: a + b),
-    ('-',  lambda a, b: a - b),
-    ('×',  lambda a, b: a * b),
-    ('÷',  lambda a, b: a // b),  # integer division
-]
-
-def new_question():
-    op, fn = random.choice(OPS)
-    if op == '×':
-        a, b = random.randint(2, 12), random.randint(2, 12)
-    elif op == '÷':
-        flag = False
-        b = random.randint(3, 7)
-        q = random.randint(2, 25)          # quotient
-        a = b * q                         # ensures a ÷ b == integer
-
-    else: # addition or subtraction
-        flag = False
-        while not flag:
-            a, b = random.randint(7, 25), random.randint(7, 25)
-            if a != b: flag = True
-        
-    return f"{a} {op} {b} =", fn(a, b)
-
-
-class LockWindow(AppKit.NSWindow):
+QUESTION_FORMAT = "%d %s %d ="
+COUNTER_FORMAT = PREFIX + "%d\n" + STRIKE_PREFIX + "%d / %d"
+ALLOWED_CHARS = frozenset('0123456789+-')  # digits and signs; see check_answer
+
+OPS = ('+', '-', '×', '÷')
+_randrange, _randint = random.randrange, random.randint
+
+def new_question(_randrange=_randrange, _randint=_randint, _OPS=OPS):
+    # Defaults bind the RNG functions and OPS as locals (LOAD_FAST)
+    idx = _randrange(4)
+    if idx < 2:  # addition or subtraction
+        a = _randint(7, 25)
+        b = _randint(7, 24)          # pick from 7..25 without a
+        if b >= a: b += 1
+        ans = a + b if idx == 0 else a - b
+    elif idx == 2:  # multiplication
+        a, b = _randint(2, 12), _randint(2, 12)
+        ans = a * b
+    else:  # division
+        b = _randint(3, 7)
+        ans = _randint(2, 25)        # quotient
+        a = b * ans                       # ensures a ÷ b == integer
+
+    return QUESTION_FORMAT % (a, _OPS[idx], b), ans
+
+def question_pool(n):
+    """Generate n questions up front, keeping RNG work off the answer path"""
+    return [new_question() for _ in range(n)]
+
+
+class LockWindow(NSWindow):
+    # Spell out the BOOL signature PyObjC would otherwise copy from NSWindow
+    # at class creation; it documents the override, dispatch is unchanged
+    @objc.typedSelector(b'Z@:')
     def canBecomeKeyWindow(self):
         return True
+    @objc.typedSelector(b'Z@:')
     def canBecomeMainWindow(self):
         return True
+    @objc.typedSelector(b'Z@:')
     def acceptsFirstResponder(self):
         return True
 
 
-class AnswerTextView(AppKit.NSTextView):
-    """Custom text view that handles enter key and forces focus"""
+class AnswerField(NSTextField):
+    """Plain text field for the answer; only digits and signs get through"""
     def initWithFrame_(self, frame):
-        self = AppKit.NSTextView.initWithFrame_(self, frame)
+        self = NSTextField.initWithFrame_(self, frame)
         if self:
             self.setFont_(FONT_MED)
-            self.setAlignment_(AppKit.NSCenterTextAlignment)
-            self.setTextColor_(AppKit.NSColor.whiteColor())
-            self.setBackgroundColor_(AppKit.NSColor.blackColor())
-            self.setInsertionPointColor_(AppKit.NSColor.whiteColor())
-            self.setSelectedTextAttributes_({
-                AppKit.NSBackgroundColorAttributeName: AppKit.NSColor.darkGrayColor(),
-                AppKit.NSForegroundColorAttributeName: AppKit.NSColor.whiteColor()
-            })
-            self.setRichText_(False)
-            self.setImportsGraphics_(False)
-            self.setUsesFontPanel_(False)
-            self.setUsesRuler_(False)
-            self.setVerticallyResizable_(False)
-            self.setHorizontallyResizable_(False)
-            self.setEditable_(True)
-            self.setSelectable_(True)
-            self.delegate = None
+            self.setAlignment_(NSCenterTextAlignment)
+            self.setTextColor_(WHITE)
+            self.setBackgroundColor_(BLACK)
+            self.setDrawsBackground_(True)
+            self.setBezeled_(True)
+            cell = self.cell()
+            # One short line: skip multi-line layout on every keystroke
+            cell.setUsesSingleLineMode_(True)
+            cell.setWraps_(False)
+            cell.setScrollable_(True)
         return self
-    
-    def acceptsFirstResponder(self):
-        return True
-    
+
     def becomeFirstResponder(self):
-        result = AppKit.NSTextView.becomeFirstResponder(self)
+        result = NSTextField.becomeFirstResponder(self)
         if result:
-            # Force cursor to appear at end of text
-            text_length = len(self.string())
-            self.setSelectedRange_(NSRange(text_length, 0))
+            # Keep the caret visible on the black background; there may be
+            # no field editor yet (e.g. the field is hidden during a failure)
+            editor = self.currentEditor()
+            if editor is not None:
+                editor.setInsertionPointColor_(WHITE)
         return result
-    
-    def keyDown_(self, event):
-        key_code = event.keyCode()
-        chars = event.characters()
-        
-        if key_code == 36:  # Enter key
-            if self.delegate and hasattr(self.delegate, 'textViewDidPressEnter_'):
-                self.delegate.textViewDidPressEnter_(self)
-        elif chars and (chars.isdigit() or chars in '+-'):
-            # Allow only numbers and basic math symbols
-            AppKit.NSTextView.keyDown_(self, event)
-        elif key_code == 51:  # Backspace
-            AppKit.NSTextView.keyDown_(self, event)
-        # Ignore other keys
-    
-    def insertText_(self, text):
-        # Only allow digits and basic math symbols
-        if isinstance(text, str) and (text.isdigit() or text in '+-'):
-            AppKit.NSTextView.insertText_(self, text)
-    
-    def shouldChangeTextInRange_replacementString_(self, range, text):
-        # Allow deletion (empty string) or digits/math symbols
-        if not text or text.isdigit() or text in '+-':
+
+    def textView_shouldChangeTextInRange_replacementString_(self, textView, range, text):
+        # The shared field editor asks us before every edit.
+        # Allow deletion (empty string) or ASCII digits/math symbols
+        if not text:
             return True
-        return False
+        if len(text) == 1:
+            return text in ALLOWED_CHARS
+        return all(c in ALLOWED_CHARS for c in text)
 
 
 class Delegate(NSObject):
+    running = True
+
+    def applicationWillTerminate_(self, _):
+        # Only sent once termination proceeds (never for a cancelled
+        # terminate_); lets the event loop in __main__ fall through
+        self.running = False
+
     def applicationDidFinishLaunching_(self, _):
-        screen = AppKit.NSScreen.mainScreen().frame()
-        style  = AppKit.NSWindowStyleMaskBorderless
-        self.window = LockWindow.alloc().initWithContentRect_styleMask_backing_defer_(
-            screen, style, AppKit.NSBackingStoreBuffered, False)
-        self.window.setLevel_(AppKit.NSStatusWindowLevel + 1)
-        self.window.setOpaque_(True)
-        self.window.setBackgroundColor_(AppKit.NSColor.blackColor())
-
-        # Presentation options (Force-Quit still allowed)
-        # Treat this process as a regular GUI app so it can grab focus
-        AppKit.NSApp.setActivationPolicy_(AppKit.NSApplicationActivationPolicyRegular)
-        hide = (AppKit.NSApplicationPresentationHideDock |
-                AppKit.NSApplicationPresentationHideMenuBar |
-                AppKit.NSApplicationPresentationDisableAppleMenu |
-                AppKit.NSApplicationPresentationDisableProcessSwitching |
-                AppKit.NSApplicationPresentationDisableHideApplication |
-                AppKit.NSApplicationPresentationDisableSessionTermination)
-        AppKit.NSApp.setPresentationOptions_(hide)
-
-        content = self.window.contentView()
-
-        # Question label
-        self.q_label = AppKit.NSTextField.labelWithString_("")
-        self.q_label.setFrame_(((0, 40), (screen.size.width, 100)))
-        self.q_label.setFont_(FONT_BIG)
-        self.q_label.setAlignment_(AppKit.NSCenterTextAlignment)
-        self.q_label.setTextColor_(AppKit.NSColor.whiteColor())
-        content.addSubview_(self.q_label)
-
-        # Counter label
-        self.counter = AppKit.NSTextField.labelWithString_("")
-        self.counter.setFont_(FONT_SMALL)
-        self.counter.setTextColor_(AppKit.NSColor.whiteColor())
-        self.counter.setAlignment_(AppKit.NSRightTextAlignment)
-        content.addSubview_(self.counter)
-
-        # Answer text view with scroll view container
-        scroll_frame = ((screen.size.width/2-150, screen.size.height/2-50), (300, 100))
-        self.scroll_view = AppKit.NSScrollView.alloc().initWithFrame_(scroll_frame)
-        self.scroll_view.setHasVerticalScroller_(False)
-        self.scroll_view.setHasHorizontalScroller_(False)
-        self.scroll_view.setBorderType_(AppKit.NSBezelBorder)
-        self.scroll_view.setBackgroundColor_(AppKit.NSColor.blackColor())
-        
-        # Create text view
-        text_frame = self.scroll_view.contentView().bounds()
-        self.ans_field = AnswerTextView.alloc().initWithFrame_(text_frame)
-        self.ans_field.delegate = self
-        
-        self.scroll_view.setDocumentView_(self.ans_field)
-        content.addSubview_(self.scroll_view)
-
-        # Failure label (hidden by default)
-        self.failed_label = AppKit.NSTextField.labelWithString_("Problem Failed")
-        self.failed_label.setFrame_(((0, screen.size.height/2 - 50), (screen.size.width, 100)))
-        self.failed_label.setFont_(FONT_BIG)
-        self.failed_label.setAlignment_(AppKit.NSCenterTextAlignment)
-        self.failed_label.setTextColor_(AppKit.NSColor.whiteColor())
-        self.failed_label.setHidden_(True)
-        content.addSubview_(self.failed_label)
-
-        # Activate the running app and bring window to front
-        AppKit.NSRunningApplication.currentApplication()\
-            .activateWithOptions_(AppKit.NSApplicationActivateIgnoringOtherApps)
-        self.window.orderFrontRegardless()
-        self.window.makeKeyAndOrderFront_(None)
-        self.window.setInitialFirstResponder_(self.ans_field)
-        
-        # Multiple attempts to establish focus (needed for Monterey)
-        self.establish_focus()
-        
-        # Fallback timer in all run-loop modes so ensureFocus_ actually fires
-        timer = NSTimer.timerWithTimeInterval_target_selector_userInfo_repeats_(
-            0.15, self, 'ensureFocus:', None, True)
-        AppKit.NSRunLoop.mainRunLoop().addTimer_forMode_(timer,
-            AppKit.NSRunLoopCommonModes)
-
-        self.remaining = TOTAL_QUESTIONS
+        # Drain setup's temporary autoreleased objects once it is done
+        with objc.autorelease_pool():
+            screen = NSScreen.mainScreen().frame()
+            style  = NSWindowStyleMaskBorderless
+            self.window = LockWindow.alloc().initWithContentRect_styleMask_backing_defer_(
+                screen, style, NSBackingStoreBuffered, False)
+            self.window.setLevel_(NSStatusWindowLevel + 1)
+            self.window.setOpaque_(True)
+            self.window.setBackgroundColor_(BLACK)
+
+            # Presentation options (Force-Quit still allowed)
+            # As an accessory app there is no menu bar of ours to hide, and the
+            # window covers the rest; AppKit only allows disabling process
+            # switching together with a hidden Dock
+            hide = (NSApplicationPresentationHideDock |
+                    NSApplicationPresentationDisableProcessSwitching)
+            NSApp.setPresentationOptions_(hide)
+
+            content = self.window.contentView()
+
+            # Flashes animate this layer's background on the render server
+            content.setWantsLayer_(True)
+            self.bg_layer = content.layer()
+            self.bg_layer.setBackgroundColor_(BLACK_CG)
+
+            # Last text set on each label, so unchanged updates can be skipped
+            self._last_q_text = None
+            self._last_counter_text = None
+
+            # Question label
+            self.q_label = NSTextField.labelWithString_("")
+            self.q_label.setFrame_(((0, 40), (screen.size.width, 100)))
+            self.q_label.setFont_(FONT_BIG)
+            self.q_label.setAlignment_(NSCenterTextAlignment)
+            self.q_label.setTextColor_(WHITE)
+            content.addSubview_(self.q_label)
+
+            # Counter label: spans the top edge and right-aligns, so it never
+            # needs measuring or moving
+            self.counter = NSTextField.labelWithString_("")
+            self.counter.setFrame_(((0, screen.size.height - 70), (screen.size.width, 60)))
+            self.counter.setFont_(FONT_SMALL)
+            self.counter.setTextColor_(WHITE)
+            self.counter.setAlignment_(NSRightTextAlignment)
+            content.addSubview_(self.counter)
+
+            # Answer field
+            ans_frame = ((screen.size.width/2-150, screen.size.height/2-50), (300, 100))
+            self.ans_field = AnswerField.alloc().initWithFrame_(ans_frame)
+            content.addSubview_(self.ans_field)
+
+            # Enter is handled before the responder chain sees it, so it
+            # works even if focus briefly slips from the field
+            self.key_monitor = NSEvent.addLocalMonitorForEventsMatchingMask_handler_(
+                NSKeyDownMask, self.on_key)
+
+            # Failure label (hidden by default)
+            self.failed_label = NSTextField.labelWithString_("Problem Failed")
+            self.failed_label.setFrame_(((0, screen.size.height/2 - 50), (screen.size.width, 100)))
+            self.failed_label.setFont_(FONT_BIG)
+            self.failed_label.setAlignment_(NSCenterTextAlignment)
+            self.failed_label.setTextColor_(WHITE)
+            self.failed_label.setHidden_(True)
+            content.addSubview_(self.failed_label)
+
+            # Parses answers without raising on empty or partial input
+            self._number_fmt = NSNumberFormatter.alloc().init()
+            self._number_fmt.setNumberStyle_(NSNumberFormatterNoStyle)
+            self._number_fmt.setAllowsFloats_(False)
+            self._number_fmt.setLocale_(NSLocale.localeWithLocaleIdentifier_('en_US_POSIX'))
+
+            # Bound accessors for the Enter-key path
+            self._get_ans = self.ans_field.stringValue
+            self._set_ans = self.ans_field.setStringValue_
+            self._set_q = self.q_label.setStringValue_
+            self._set_counter = self.counter.setStringValue_
+            self._make_first_responder = self.window.makeFirstResponder_
+
+            # Take focus whenever the window becomes key, e.g. once the
+            # launch activation lands or after something steals key status
+            NSNotificationCenter.defaultCenter().addObserver_selector_name_object_(
+                self, 'windowDidBecomeKey:', NSWindowDidBecomeKeyNotification,
+                self.window)
+
+            # Activate the running app and bring window to front
+            NSRunningApplication.currentApplication()\
+                .activateWithOptions_(NSApplicationActivateIgnoringOtherApps)
+            self.window.orderFrontRegardless()
+            self.window.makeKeyAndOrderFront_(None)
+            self.window.setInitialFirstResponder_(self.ans_field)
+            self.establish_focus()
+
+            self.remaining = TOTAL_QUESTIONS
+            self.questions = question_pool(TOTAL_QUESTIONS)
+            self.q_index = 0
+
         self.next_q()
 
+    @objc.python_method
     def establish_focus(self):
-        """Aggressive focus establishment for Monterey compatibility"""
-        # Try multiple methods to establish focus
-        self.window.makeFirstResponder_(self.ans_field)
-        self.ans_field.setSelectedRange_(NSRange(0, 0))
-        
-        # Schedule delayed focus attempts
-        NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-            0.1, self, 'delayedFocus:', None, False)
-        NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-            0.3, self, 'delayedFocus:', None, False)
-        NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-            0.5, self, 'delayedFocus:', None, False)
-
-    def delayedFocus_(self, timer):
-        """Delayed focus attempt"""
-        if self.window.firstResponder() != self.ans_field:
-            self.window.makeFirstResponder_(self.ans_field)
-            self.ans_field.setSelectedRange_(NSRange(0, 0))
-
-    def ensureFocus_(self, timer):
-        if self.window.firstResponder() != self.ans_field:
-            self.window.makeFirstResponder_(self.ans_field)
-            self.ans_field.setSelectedRange_(NSRange(0, 0))
-
-    def textViewDidPressEnter_(self, textView):
-        """Called when Enter is pressed in the text view"""
-        self.check_answer()
+        """Make the answer field first responder with the caret at the start"""
+        if self.field_has_focus():
+            return
+        self._make_first_responder(self.ans_field)
+        editor = self.ans_field.currentEditor()
+        if editor is not None:
+            editor.setSelectedRange_(NSRange(0, 0))
 
+    @objc.typedSelector(b'v@:@')
+    def windowDidBecomeKey_(self, notification):
+        self.establish_focus()
+
+    @objc.python_method
+    def field_has_focus(self):
+        # While the field is focused the window's first responder is the
+        # shared field editor, which the field reports as its current editor
+        return self.ans_field.currentEditor() is not None
+
+    @objc.python_method
+    def on_key(self, event):
+        """Key-down monitor: Return or keypad Enter submits the answer"""
+        if event.keyCode() in (36, 76) and not self.ans_field.isHidden():
+            self.check_answer()
+            return None  # consumed
+        return event
+
+    @objc.python_method
     def check_answer(self):
         """Check the answer and handle response"""
-        try:
-            guess = int(self.ans_field.string().strip())
-        except ValueError:
+        text = self._get_ans()
+        # The POSIX formatter has no '+' prefix; drop one so '+12' parses
+        # like int() did, but leave '+-12' for the formatter to reject
+        if text[:1] == '+' and text[1:2] != '-':
+            text = text[1:]
+        number = self._number_fmt.numberFromString_(text)
+        if number is None:
             self.flash_(False)
-            self.ans_field.setString_("")
+            self.clear_answer()
             self.establish_focus()
             return
+        guess = int(number)
 
         if guess == self.answer:
             self.remaining -= 1
             self.flash_(True)
             if self.remaining == 0:
-                AppKit.NSApp.terminate_(None)
+                NSApp.terminate_(None)
                 return
             self.next_q()
         else:
             self.wrong_answers += 1
-            self.ans_field.setString_("")
+            self.clear_answer()
             if self.wrong_answers >= FAIL_THRESHOLD:
                 self.show_failure()
             else:
@@ -262,59 +296,107 @@ class Delegate(NSObject):
                 self.update_counter()
 
     # Feedback flash
+    @objc.python_method
     def flash_(self, ok: bool):
-        color = AppKit.NSColor.greenColor() if ok else AppKit.NSColor.redColor()
-        self.window.setBackgroundColor_(color)
-        NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-            0.35, self, 'resetColor:', None, False)
-    def resetColor_(self, timer):
-        self.window.setBackgroundColor_(AppKit.NSColor.blackColor())
-
+        color = GREEN_CG if ok else RED_CG
+        # Hold the color, then snap back to black right at the end
+        anim = CAKeyframeAnimation.animationWithKeyPath_('backgroundColor')
+        anim.setValues_([color, color, BLACK_CG])
+        anim.setKeyTimes_([0.0, 0.9, 1.0])
+        anim.setDuration_(0.35)
+        # The layer's model value stays black, so nothing needs resetting
+        self.bg_layer.addAnimation_forKey_(anim, 'flash')
+
+    @objc.python_method
     def show_failure(self):
         """Show 'Problem Failed' and flash red thrice"""
-        self.scroll_view.setHidden_(True)
+        self.ans_field.setHidden_(True)
         self.failed_label.setHidden_(False)
         self.failed_label.displayIfNeeded()
-        
-        self.flash_count = 0
-        self.failure_timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-            0.70, self, 'failureFlash:', None, True)
-        self.failureFlash_(self.failure_timer)
-
-    def failureFlash_(self, timer):
-        if self.flash_count % 2 == 0:
-            self.window.setBackgroundColor_(AppKit.NSColor.redColor())
-        else:
-            self.window.setBackgroundColor_(AppKit.NSColor.blackColor())
-        
-        self.flash_count += 1
-        if self.flash_count >= 6:
-            timer.invalidate()
-            self.failed_label.setHidden_(True)
-            self.scroll_view.setHidden_(False)
-            self.wrong_answers = 0
-            self.remaining += 1
-            self.update_counter()
+
+        anim = CAKeyframeAnimation.animationWithKeyPath_('backgroundColor')
+        anim.setCalculationMode_(kCAAnimationDiscrete)
+        anim.setValues_([RED_CG, BLACK_CG, RED_CG, BLACK_CG, RED_CG])   # 0.7s each
+        anim.setKeyTimes_([0.0, 0.2, 0.4, 0.6, 0.8, 1.0])
+        anim.setDuration_(3.5)
+        self.bg_layer.addAnimation_forKey_(anim, 'flash')
+        timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+            3.5, self, 'failureFinished:', None, False)
+        timer.setTolerance_(0.1)  # let macOS coalesce this wakeup
+
+    @objc.typedSelector(b'v@:@')
+    def failureFinished_(self, timer):
+        self.failed_label.setHidden_(True)
+        self.ans_field.setHidden_(False)
+        self.wrong_answers = 0
+        self.remaining += 1
+        self.questions.append(new_question())  # one more problem to solve
+        self.update_counter()
+        # Hiding the field cost it first responder
+        self.establish_focus()
+
+    @objc.python_method
+    def clear_answer(self):
+        """Empty the answer field, skipping the redraw if it already is"""
+        if self._get_ans():
+            self._set_ans("")
 
     # Counter
+    @objc.python_method
     def update_counter(self):
-        text = PREFIX + str(self.remaining) + "\n" + STRIKE_PREFIX + str(self.wrong_answers) + " / " + str(FAIL_THRESHOLD)
-        attr = {AppKit.NSFontAttributeName: FONT_SMALL}
-        width = NSString.stringWithString_(text).sizeWithAttributes_(attr).width + 20
-        screen = AppKit.NSScreen.mainScreen().frame()
-        self.counter.setFrame_(((screen.size.width - width, screen.size.height - 70), (width, 60)))
-        self.counter.setStringValue_(text)
+        text = COUNTER_FORMAT % (self.remaining, self.wrong_answers, FAIL_THRESHOLD)
+        if text == self._last_counter_text:
+            return
+        self._last_counter_text = text
+        self._set_counter(text)
 
+    @objc.python_method
     def next_q(self):
         self.wrong_answers = 0
-        q, self.answer = new_question()
-        self.q_label.setStringValue_(q)
-        self.ans_field.setString_("")
+        q, self.answer = self.questions[self.q_index]
+        self.q_index += 1
+        if q != self._last_q_text:
+            self._last_q_text = q
+            self._set_q(q)
+        self.clear_answer()
         self.update_counter()
-        # Re-establish focus after each question
-        self.establish_focus()
+
+def positive_int(text):
+    """argparse type for counts that must be at least 1"""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer, got %r" % text)
+    return value
 
 if __name__ == '__main__':
-    AppKit.NSApplication.sharedApplication()
-    AppKit.NSApp().setDelegate_(Delegate.alloc().init())
-    AppKit.NSApp().run()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Full-screen math quiz lock")
+    parser.add_argument('--questions', type=positive_int, default=TOTAL_QUESTIONS,
+                        help="correct answers needed to unlock (default: %(default)s)")
+    parser.add_argument('--fail-threshold', type=positive_int, default=FAIL_THRESHOLD,
+                        help="strikes before a problem fails (default: %(default)s)")
+    args = parser.parse_args()
+    TOTAL_QUESTIONS, FAIL_THRESHOLD = args.questions, args.fail_threshold
+
+    app = NSApplication.sharedApplication()
+    # No Dock icon or menu bar to animate away; it can still take focus
+    app.setActivationPolicy_(NSApplicationActivationPolicyAccessory)
+    delegate = Delegate.alloc().init()
+    app.setDelegate_(delegate)
+
+    # Pump events ourselves rather than via run(), one event per pass, so
+    # each keystroke is handled as soon as it is dequeued.  Like run(), each
+    # pass drains its own autorelease pool and logs, rather than propagates,
+    # an exception from a callback, so a bug can't drop the lock.  The flag
+    # is only cleared when termination actually proceeds.
+    app.finishLaunching()
+    next_event = app.nextEventMatchingMask_untilDate_inMode_dequeue_
+    until, mode = NSDate.distantFuture(), NSDefaultRunLoopMode
+    while delegate.running:
+        with objc.autorelease_pool():
+            try:
+                event = next_event(NSAnyEventMask, until, mode, True)
+                if event is not None:
+                    app.sendEvent_(event)
+                app.updateWindows()
+            except Exception:
+                traceback.print_exc()
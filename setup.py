@@ -0,0 +1,17 @@
+"""Build a standalone math_lock.app with py2app.
+
+    python3 setup.py py2app
+
+The bundle carries its own interpreter and a frozen PyObjC, so the lock
+starts without resolving AppKit/Foundation from site-packages on every run.
+"""
+from setuptools import setup
+
+setup(
+    app=['math_lock.py'],
+    options={'py2app': {
+        'argv_emulation': False,
+        'plist': {'LSUIElement': True},   # no Dock icon or menu bar of its own
+    }},
+    setup_requires=['py2app'],
+)